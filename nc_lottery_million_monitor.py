@@ -18,40 +18,108 @@ Run manually when planning a session.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
+from jinja2 import Environment, FileSystemLoader, select_autoescape
 import re
-import time
-from typing import List, Tuple, Optional, Dict
+import asyncio
+import functools
+import gzip
+import logging
+import random
+from typing import ClassVar, Iterable, Iterator, List, Literal, NamedTuple, Tuple, Optional, Dict
 from dataclasses import dataclass, field
-from datetime import datetime, timezone, timedelta
+from operator import attrgetter
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+import argparse
 import os
 import sys
-import json
 
 
-def get_eastern_time():
+# EXSLT regex namespace, for matching scratch-off links inside XPath
+_XPATH_NS = {'re': 'http://exslt.org/regular-expressions'}
+
+# XPath queries compiled once and reused for every page and table
+_XP_GAME_TABLES = etree.XPath('//table[.//a[contains(@href, "/scratch-off/")]]')
+_XP_GAME_LINKS = etree.XPath('.//a[re:test(@href, "/scratch-off/\\d+/")]', namespaces=_XPATH_NS)
+_XP_GAME_HREFS = etree.XPath('.//a[re:test(@href, "/scratch-off/\\d+/")]/@href', namespaces=_XPATH_NS)
+# Elements with a text node containing $label, which must be passed lower-case
+_XP_LABELLED = etree.XPath(
+    '//*[text()[contains(translate(., "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"), $label)]]')
+
+# requests has already decoded the page; re-encoded text is parsed as UTF-8
+# whatever an <?xml encoding=...?> declaration claims
+_UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# Patterns used on every game row/page, compiled once
+_RE_SCRATCH_HREF = re.compile(r'/scratch-off/(\d+)/')
+_RE_GAME_NUM = re.compile(r'Game\s*Number:\s*(\d+)')
+_RE_TICKET_PRICE = re.compile(r'Ticket\s*Price\s*\$(\d+)', re.IGNORECASE)
+_RE_START_DATE = re.compile(r'Start\s*Date[:\s]*([A-Za-z]+\s+\d+,?\s+\d{4})', re.IGNORECASE)
+_RE_BEGAN = re.compile(r'Began[:\s]*([A-Za-z]+\s+\d+,?\s+\d{4})', re.IGNORECASE)
+_RE_DOLLAR_INT = re.compile(r'\$(\d+)')
+
+# Currency symbols, thousands separators and whitespace dropped from prize cells
+_STRIP_TABLE = str.maketrans('', '', '$, \t\r\n')
+
+# NC Lottery runs on Eastern time; ZoneInfo handles the EST/EDT switch
+_EASTERN = ZoneInfo('America/New_York')
+
+# End and claim-deadline dates on the games-ending page
+_ENDING_DATE_FMT = '%b %d, %Y'
+
+# Start date formats seen on game pages, most common first
+_DATE_FORMATS = ('%b %d, %Y', '%m/%d/%Y', '%Y-%m-%d')
+
+# Timestamps in the console banner and the report header
+_CONSOLE_TIME_FMT = '%Y-%m-%d %H:%M:%S'
+_REPORT_TIME_FMT = '%B %d, %Y at %I:%M %p %Z'
+
+# Scraper progress; main() attaches the handler and picks the level
+logger = logging.getLogger("nclottery")
+
+
+def get_eastern_time() -> datetime:
     """Get current time in Eastern timezone"""
-    utc_now = datetime.now(timezone.utc)
-    eastern = utc_now - timedelta(hours=5)
-    return eastern
+    return datetime.now(_EASTERN)
+
 
+def _percent(remaining: int, total: int) -> float:
+    """remaining / total as a percentage, 0 for an empty bucket"""
+    return (remaining / total * 100) if total > 0 else 0.0
 
-@dataclass
+
+@dataclass(slots=True)
 class PrizeTier:
     """Represents a single prize tier"""
     value: float
     total: int
     remaining: int
     
+    # Fixed per tier, so computed once in __post_init__
+    _pct: float = field(default=0.0, init=False, repr=False, compare=False)
+    _is_million_plus: bool = field(default=False, init=False, repr=False, compare=False)
+    _is_small_win: bool = field(default=False, init=False, repr=False, compare=False)
+    _is_medium_win: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        value = self.value
+        self._pct = (self.remaining / self.total) * 100 if self.total else 0.0
+        self._is_million_plus = value >= 1_000_000
+        self._is_small_win = 500 <= value <= 1_000
+        self._is_medium_win = 2_000 <= value <= 10_000
+    
     @property
     def percent_remaining(self) -> float:
-        if self.total == 0:
-            return 0.0
-        return (self.remaining / self.total) * 100
+        return self._pct
     
     @property
     def is_million_plus(self) -> bool:
-        return self.value >= 1_000_000
+        return self._is_million_plus
     
     def is_break_even_tier(self, ticket_price: float) -> bool:
         """Break-even tier: 2x to 10x ticket price"""
@@ -61,14 +129,29 @@ class PrizeTier:
     
     def is_small_win_tier(self) -> bool:
         """Small wins: $500 - $1,000"""
-        return 500 <= self.value <= 1_000
+        return self._is_small_win
     
     def is_medium_win_tier(self) -> bool:
         """Medium wins: $2,000 - $10,000"""
-        return 2_000 <= self.value <= 10_000
+        return self._is_medium_win
+
+
+# Report section a game is sorted into
+Category = Literal["HOT", "WATCH", "AVOID"]
 
 
-@dataclass 
+class GameMetrics(NamedTuple):
+    """Per-game figures shared by scoring, categorizing and the report"""
+    million_rem: int
+    million_tot: int
+    million_pct: float
+    loss_min_score: float
+    bottom_pct: float
+    diff: float
+    days: Optional[int]
+
+
+@dataclass(slots=True)
 class GameData:
     """Data structure for a scratch-off game"""
     game_number: str
@@ -79,30 +162,92 @@ class GameData:
     status: str = ""
     prize_tiers: List[PrizeTier] = field(default_factory=list)
     
+    # Derived tier lists and (total, remaining) sums, rebuilt by _compute_derived_tiers()
+    _million_tiers: List[PrizeTier] = field(default_factory=list, init=False, repr=False, compare=False)
+    _be_tiers: List[PrizeTier] = field(default_factory=list, init=False, repr=False, compare=False)
+    _sw_tiers: List[PrizeTier] = field(default_factory=list, init=False, repr=False, compare=False)
+    _mw_tiers: List[PrizeTier] = field(default_factory=list, init=False, repr=False, compare=False)
+    _million_sums: Tuple[int, int] = field(default=(0, 0), init=False, repr=False, compare=False)
+    _be_sums: Tuple[int, int] = field(default=(0, 0), init=False, repr=False, compare=False)
+    _sw_sums: Tuple[int, int] = field(default=(0, 0), init=False, repr=False, compare=False)
+    _mw_sums: Tuple[int, int] = field(default=(0, 0), init=False, repr=False, compare=False)
+    _top_prize: Optional[PrizeTier] = field(default=None, init=False, repr=False, compare=False)
+    _bottom_prize: Optional[PrizeTier] = field(default=None, init=False, repr=False, compare=False)
+    # (start_date, days) from the last days_since_launch() call
+    _days_cache: Optional[Tuple[str, Optional[int]]] = field(default=None, init=False, repr=False, compare=False)
+    # Ranking results, filled in once by rank_games()
+    _metrics: Optional[GameMetrics] = field(default=None, init=False, repr=False, compare=False)
+    _score: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _category: Optional[Category] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Format that parsed the last start date; pages share one format, so try it first
+    _last_date_fmt: ClassVar[str] = _DATE_FORMATS[0]
+    
+    def __post_init__(self):
+        self._compute_derived_tiers()
+    
+    def _compute_derived_tiers(self):
+        """
+        Bucket prize tiers, sum each bucket and find the top/bottom prize
+        in a single pass. Call again after prize_tiers or ticket_price change.
+        """
+        million, be, sw, mw = [], [], [], []
+        top = bottom = None
+        m_tot = m_rem = be_tot = be_rem = sw_tot = sw_rem = mw_tot = mw_rem = 0
+        floor = self.ticket_price * 2
+        ceiling = self.ticket_price * 10
+        
+        for t in self.prize_tiers:
+            v = t.value
+            if top is None or v > top.value:
+                top = t
+            if bottom is None or v < bottom.value:
+                bottom = t
+            if t._is_million_plus:
+                million.append(t)
+                m_tot += t.total
+                m_rem += t.remaining
+            if floor <= v <= ceiling:
+                be.append(t)
+                be_tot += t.total
+                be_rem += t.remaining
+            if t._is_small_win:
+                sw.append(t)
+                sw_tot += t.total
+                sw_rem += t.remaining
+            elif t._is_medium_win:
+                mw.append(t)
+                mw_tot += t.total
+                mw_rem += t.remaining
+        
+        # Cards list the $1M+ tiers highest first
+        million.sort(key=attrgetter('value'), reverse=True)
+        self._million_tiers, self._million_sums = million, (m_tot, m_rem)
+        self._be_tiers, self._be_sums = be, (be_tot, be_rem)
+        self._sw_tiers, self._sw_sums = sw, (sw_tot, sw_rem)
+        self._mw_tiers, self._mw_sums = mw, (mw_tot, mw_rem)
+        self._top_prize, self._bottom_prize = top, bottom
+    
     def get_top_prize(self) -> Optional[PrizeTier]:
-        if not self.prize_tiers:
-            return None
-        return max(self.prize_tiers, key=lambda x: x.value)
+        return self._top_prize
     
     def get_bottom_prize(self) -> Optional[PrizeTier]:
-        if not self.prize_tiers:
-            return None
-        return min(self.prize_tiers, key=lambda x: x.value)
+        return self._bottom_prize
     
     def get_million_plus_tiers(self) -> List[PrizeTier]:
-        return [t for t in self.prize_tiers if t.is_million_plus]
+        return self._million_tiers
     
     def get_break_even_tiers(self) -> List[PrizeTier]:
         """Get tiers in break-even range (2x to 10x ticket price)"""
-        return [t for t in self.prize_tiers if t.is_break_even_tier(self.ticket_price)]
+        return self._be_tiers
     
     def get_small_win_tiers(self) -> List[PrizeTier]:
         """Get tiers in $500-$1,000 range"""
-        return [t for t in self.prize_tiers if t.is_small_win_tier()]
+        return self._sw_tiers
     
     def get_medium_win_tiers(self) -> List[PrizeTier]:
         """Get tiers in $2,000-$10,000 range"""
-        return [t for t in self.prize_tiers if t.is_medium_win_tier()]
+        return self._mw_tiers
     
     def calculate_differential(self) -> float:
         """Overall differential: top prize % - bottom prize %"""
@@ -114,13 +259,8 @@ class GameData:
     
     def calculate_million_health(self) -> Tuple[int, int, float]:
         """Returns (remaining, total, percent) for $1M+ prizes"""
-        million_tiers = self.get_million_plus_tiers()
-        if not million_tiers:
-            return 0, 0, 0.0
-        total = sum(t.total for t in million_tiers)
-        remaining = sum(t.remaining for t in million_tiers)
-        pct = (remaining / total * 100) if total > 0 else 0.0
-        return remaining, total, pct
+        total, remaining = self._million_sums
+        return remaining, total, _percent(remaining, total)
     
     def calculate_loss_minimization_score(self) -> float:
         """
@@ -133,32 +273,9 @@ class GameData:
         
         Returns score from 0-100.
         """
-        # Break-even tier (50% weight)
-        break_even = self.get_break_even_tiers()
-        if break_even:
-            be_total = sum(t.total for t in break_even)
-            be_remaining = sum(t.remaining for t in break_even)
-            be_pct = (be_remaining / be_total * 100) if be_total > 0 else 0
-        else:
-            be_pct = 0
-        
-        # Small wins tier (30% weight)
-        small_wins = self.get_small_win_tiers()
-        if small_wins:
-            sw_total = sum(t.total for t in small_wins)
-            sw_remaining = sum(t.remaining for t in small_wins)
-            sw_pct = (sw_remaining / sw_total * 100) if sw_total > 0 else 0
-        else:
-            sw_pct = 0
-        
-        # Medium wins tier (20% weight)
-        medium_wins = self.get_medium_win_tiers()
-        if medium_wins:
-            mw_total = sum(t.total for t in medium_wins)
-            mw_remaining = sum(t.remaining for t in medium_wins)
-            mw_pct = (mw_remaining / mw_total * 100) if mw_total > 0 else 0
-        else:
-            mw_pct = 0
+        be_pct = _percent(self._be_sums[1], self._be_sums[0])
+        sw_pct = _percent(self._sw_sums[1], self._sw_sums[0])
+        mw_pct = _percent(self._mw_sums[1], self._mw_sums[0])
         
         # Weighted score
         score = (be_pct * 0.50) + (sw_pct * 0.30) + (mw_pct * 0.20)
@@ -172,23 +289,32 @@ class GameData:
         return bottom.percent_remaining
     
     def has_million_plus(self) -> bool:
-        return len(self.get_million_plus_tiers()) > 0
+        return len(self._million_tiers) > 0
     
     def days_since_launch(self) -> Optional[int]:
         """Calculate days since game launched"""
         if not self.start_date:
             return None
-        try:
-            # Try different date formats
-            for fmt in ['%b %d, %Y', '%m/%d/%Y', '%Y-%m-%d']:
-                try:
-                    launch = datetime.strptime(self.start_date, fmt)
-                    return (datetime.now() - launch).days
-                except ValueError:
-                    continue
-            return None
-        except:
-            return None
+        if self._days_cache is not None and self._days_cache[0] == self.start_date:
+            return self._days_cache[1]
+        
+        launch = self._parse_start_date(self.start_date)
+        days = (get_eastern_time().date() - launch.date()).days if launch else None
+        self._days_cache = (self.start_date, days)
+        return days
+    
+    @classmethod
+    def _parse_start_date(cls, date_str: str) -> Optional[datetime]:
+        """Parse a start date, trying the last format that worked first"""
+        last = cls._last_date_fmt
+        for fmt in (last, *(f for f in _DATE_FORMATS if f != last)):
+            try:
+                launch = datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
+            cls._last_date_fmt = fmt
+            return launch
+        return None
 
 
 class NCLotteryAnalyzer:
@@ -197,45 +323,74 @@ class NCLotteryAnalyzer:
     BASE_URL = "https://nclottery.com"
     PRIZES_URL = f"{BASE_URL}/scratch-off-prizes-remaining"
     GAMES_ENDING_URL = f"{BASE_URL}/scratch-off-games-ending"
+    REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+    CACHE_NAME = "nc_lottery_cache"
+    CACHE_EXPIRY = timedelta(hours=6)
     
-    def __init__(self, delay_seconds: float = 0.5, verbose: bool = True):
+    def __init__(self, delay_seconds: float = 0.5, verbose: bool = True,
+                 max_concurrency: int = 8, use_cache: bool = True):
         self.delay = delay_seconds
+        self.max_concurrency = max_concurrency
         self.verbose = verbose
-        self.session = requests.Session()
+        if use_cache:
+            # SQLite cache in the user cache dir, so it never lands in the published site;
+            # a stale copy is served if the site is unreachable
+            self.session = CachedSession(
+                self.CACHE_NAME,
+                use_cache_dir=True,
+                expire_after=self.CACHE_EXPIRY,
+                allowable_methods=['GET'],
+                stale_if_error=True,
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
         })
+        # Pool sized above max_concurrency so concurrent fetches reuse connections;
+        # urllib3 handles retries (including transient 5xx) with exponential backoff
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+        self.session.mount('https://', adapter)
         self.games_in_claims = set()
     
-    def log(self, message: str):
+    def log(self, message: str, level: int = logging.INFO):
         if self.verbose:
-            print(message)
+            logger.log(level, message)
     
     def fetch_page(self, url: str) -> Optional[str]:
-        max_retries = 3
-        for attempt in range(max_retries):
+        try:
+            response = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            self.log(f"  Request failed for {url}: {e}", logging.WARNING)
+            return None
+    
+    def parse_page(self, html: str, url: str):
+        """Parse fetched HTML, or log and return None for an empty or unparseable page"""
+        try:
             try:
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                return response.text
-            except requests.RequestException as e:
-                self.log(f"  Attempt {attempt + 1}/{max_retries} failed: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(self.delay * 2)
-        return None
+                return lxml.html.fromstring(html)
+            except ValueError:
+                # lxml refuses str input that carries an XML encoding declaration
+                return lxml.html.fromstring(html.encode('utf-8'), parser=_UTF8_HTML_PARSER)
+        except (etree.ParserError, ValueError) as e:
+            self.log(f"  Could not parse {url}: {e}", logging.WARNING)
+            return None
     
     def parse_prize_value(self, prize_str: str) -> float:
-        cleaned = prize_str.replace('$', '').replace(',', '').strip()
         try:
-            return float(cleaned)
+            return float(prize_str.translate(_STRIP_TABLE))
         except ValueError:
             return 0.0
     
     def parse_number(self, num_str: str) -> int:
-        cleaned = num_str.replace(',', '').strip()
         try:
-            return int(cleaned)
+            return int(num_str.translate(_STRIP_TABLE))
         except ValueError:
             return 0
     
@@ -245,93 +400,100 @@ class NCLotteryAnalyzer:
         if not html:
             return set()
         
-        soup = BeautifulSoup(html, 'html.parser')
+        doc = self.parse_page(html, self.GAMES_ENDING_URL)
+        if doc is None:
+            return set()
         claims_games = set()
-        today = datetime.now()
-        
-        tables = soup.find_all('table')
-        for table in tables:
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) >= 5:
-                    try:
-                        game_num = cells[0].get_text(strip=True)
-                        end_date_str = cells[3].get_text(strip=True)
-                        claim_date_str = cells[4].get_text(strip=True)
-                        
-                        try:
-                            end_date = datetime.strptime(end_date_str, '%b %d, %Y')
-                            claim_date = datetime.strptime(claim_date_str, '%b %d, %Y')
-                            
-                            if end_date < today <= claim_date:
-                                claims_games.add(game_num)
-                        except ValueError:
-                            pass
-                    except (IndexError, AttributeError):
-                        continue
+        today = get_eastern_time().date()
+        
+        for row in doc.iter('tr'):
+            cells = row.findall('td')
+            if len(cells) < 5:
+                continue
+            game_num = cells[0].text_content().strip()
+            try:
+                end_date = datetime.strptime(cells[3].text_content().strip(), _ENDING_DATE_FMT).date()
+                claim_date = datetime.strptime(cells[4].text_content().strip(), _ENDING_DATE_FMT).date()
+            except ValueError:
+                continue
+            
+            if end_date < today <= claim_date:
+                claims_games.add(game_num)
         
         return claims_games
     
     def get_game_details_from_page(self, game_url: str) -> Tuple[float, Optional[str]]:
         """Get ticket price and start date from game page"""
-        time.sleep(self.delay)
-        
         html = self.fetch_page(game_url)
         if not html:
             return 0.0, None
         
-        soup = BeautifulSoup(html, 'html.parser')
-        page_text = soup.get_text()
+        doc = self.parse_page(html, game_url)
+        if doc is None:
+            return 0.0, None
         
         # Get price
         price = 0.0
-        price_match = re.search(r'Ticket\s*Price\s*\$(\d+)', page_text, re.IGNORECASE)
+        price_match = self._search_snippets(_RE_TICKET_PRICE, self._label_snippets(doc, 'Ticket Price'))
+        if not price_match:
+            price_match = self._search_snippets(_RE_DOLLAR_INT, self._label_snippets(doc, 'Ticket Price'))
         if price_match:
             price = float(price_match.group(1))
-        else:
-            for element in soup.find_all(['div', 'span', 'p', 'td']):
-                text = element.get_text(strip=True)
-                if 'Ticket Price' in text:
-                    price_match = re.search(r'\$(\d+)', text)
-                    if price_match:
-                        price = float(price_match.group(1))
-                        break
         
         # Get start date
         start_date = None
-        date_match = re.search(r'Start\s*Date[:\s]*([A-Za-z]+\s+\d+,?\s+\d{4})', page_text, re.IGNORECASE)
+        date_match = self._search_snippets(_RE_START_DATE, self._label_snippets(doc, 'Start Date'))
+        if not date_match:
+            # Try another pattern
+            date_match = self._search_snippets(_RE_BEGAN, self._label_snippets(doc, 'Began'))
         if date_match:
             start_date = date_match.group(1)
-        else:
-            # Try another pattern
-            date_match = re.search(r'Began[:\s]*([A-Za-z]+\s+\d+,?\s+\d{4})', page_text, re.IGNORECASE)
-            if date_match:
-                start_date = date_match.group(1)
         
         return price, start_date
     
+    @staticmethod
+    def _label_snippets(doc, label: str) -> Iterator[str]:
+        """
+        Text around each element whose own text contains `label` (any case):
+        the element itself, then each enclosing cell, row and block in turn,
+        so values split across sibling cells or nested divs are still found.
+        Lazy, so the search stops at the innermost snippet that matches.
+        """
+        for element in _XP_LABELLED(doc, label=label.lower()):
+            yield element.text_content()
+            for ancestor in element.iterancestors():
+                yield ancestor.text_content()
+    
+    @staticmethod
+    def _search_snippets(pattern: re.Pattern, snippets: Iterable[str]) -> Optional[re.Match]:
+        for snippet in snippets:
+            match = pattern.search(snippet)
+            if match:
+                return match
+        return None
+    
     def parse_game_section(self, game_table) -> Optional[GameData]:
         try:
-            rows = game_table.find_all('tr')
+            rows = list(game_table.iter('tr'))
             if len(rows) < 2:
                 return None
             
             header_row = rows[0]
-            game_link = header_row.find('a', href=re.compile(r'/scratch-off/\d+/'))
-            if not game_link:
+            game_links = _XP_GAME_LINKS(header_row)
+            if not game_links:
                 return None
+            game_link = game_links[0]
             
-            href = game_link['href']
-            game_name = game_link.get_text(strip=True)
+            href = game_link.get('href')
+            game_name = game_link.text_content().strip()
             
-            game_num_match = re.search(r'/scratch-off/(\d+)/', href)
+            game_num_match = _RE_SCRATCH_HREF.search(href)
             if not game_num_match:
                 return None
             game_number = game_num_match.group(1)
             
-            header_text = header_row.get_text()
-            num_in_text = re.search(r'Game\s*Number:\s*(\d+)', header_text)
+            header_text = header_row.text_content()
+            num_in_text = _RE_GAME_NUM.search(header_text)
             if num_in_text:
                 game_number = num_in_text.group(1)
             
@@ -340,10 +502,10 @@ class NCLotteryAnalyzer:
             
             prize_tiers = []
             for row in rows[1:]:
-                cells = row.find_all('td')
+                cells = row.findall('td')
                 if len(cells) >= 4:
                     try:
-                        value_text = cells[0].get_text(strip=True)
+                        value_text = cells[0].text_content().strip()
                         if not value_text.startswith('$'):
                             continue
                         
@@ -351,8 +513,8 @@ class NCLotteryAnalyzer:
                         if prize_value <= 0:
                             continue
                         
-                        total = self.parse_number(cells[2].get_text(strip=True))
-                        remaining = self.parse_number(cells[3].get_text(strip=True))
+                        total = self.parse_number(cells[2].text_content().strip())
+                        remaining = self.parse_number(cells[3].text_content().strip())
                         
                         if total > 0:
                             prize_tiers.append(PrizeTier(
@@ -378,8 +540,13 @@ class NCLotteryAnalyzer:
         except Exception as e:
             return None
     
-    def scrape_all_games(self) -> List[GameData]:
-        """Scrape all active games with full prize tier data"""
+    def scrape_all_games(self, million_only: bool = False) -> List[GameData]:
+        """
+        Scrape all active games with full prize tier data.
+        
+        With million_only, games without a $1M+ tier are dropped before their
+        detail page is fetched; tier values come from the index page alone.
+        """
         self.games_in_claims = self.get_games_in_claims_period()
         
         self.log("\nFetching prizes remaining page...")
@@ -387,21 +554,24 @@ class NCLotteryAnalyzer:
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        doc = self.parse_page(html, self.PRIZES_URL)
+        if doc is None:
+            return []
         games = []
-        all_tables = soup.find_all('table')
+        all_tables = _XP_GAME_TABLES(doc)
         
         self.log(f"Found {len(all_tables)} tables to analyze...")
         
         processed_games = set()
+        candidate_games = []
         
         for table in all_tables:
-            game_link = table.find('a', href=re.compile(r'/scratch-off/\d+/'))
-            if not game_link:
+            hrefs = _XP_GAME_HREFS(table)
+            if not hrefs:
                 continue
             
-            href = game_link['href']
-            game_num_match = re.search(r'/scratch-off/(\d+)/', href)
+            href = hrefs[0]
+            game_num_match = _RE_SCRATCH_HREF.search(href)
             if not game_num_match:
                 continue
             
@@ -419,27 +589,55 @@ class NCLotteryAnalyzer:
             
             if game_data:
                 processed_games.add(game_number)
-                self.log(f"Processing Game #{game_data.game_number}: {game_data.game_name}")
-                
-                price, start_date = self.get_game_details_from_page(game_data.url)
-                game_data.ticket_price = price
-                game_data.start_date = start_date
-                
-                if game_data.ticket_price > 0:
-                    has_million = "[$1M+]" if game_data.has_million_plus() else ""
-                    self.log(f"  Price: ${game_data.ticket_price:.0f}, Tiers: {len(game_data.prize_tiers)} {has_million}")
-                    games.append(game_data)
+                if million_only and not game_data.has_million_plus():
+                    continue
+                candidate_games.append(game_data)
+        
+        self.log(f"Fetching details for {len(candidate_games)} games...")
+        asyncio.run(self._fetch_all_details(candidate_games))
+        
+        for game_data in candidate_games:
+            self.log(f"Processing Game #{game_data.game_number}: {game_data.game_name}")
+            if game_data.ticket_price > 0:
+                has_million = "[$1M+]" if game_data.has_million_plus() else ""
+                self.log(f"  Price: ${game_data.ticket_price:.0f}, Tiers: {len(game_data.prize_tiers)} {has_million}")
+                games.append(game_data)
         
         return games
     
+    async def _fetch_details(self, game_data: GameData, limiter: asyncio.Semaphore):
+        """
+        Fill in ticket price and start date, throttled by the shared limiter.
+        A failure is logged and leaves the price at 0, so only that game is dropped.
+        """
+        async with limiter:
+            # Jittered so the workers don't hit the site in lockstep
+            await asyncio.sleep(self.delay * random.uniform(0.5, 1.5))
+            try:
+                price, start_date = await asyncio.to_thread(
+                    self.get_game_details_from_page, game_data.url)
+            except Exception as e:
+                self.log(f"  Failed to read details for Game #{game_data.game_number}: {e}",
+                         logging.WARNING)
+                price, start_date = 0.0, None
+        game_data.ticket_price = price
+        game_data.start_date = start_date
+        game_data._compute_derived_tiers()
+    
+    async def _fetch_all_details(self, games: List[GameData]):
+        """Fetch detail pages concurrently, at most max_concurrency at a time"""
+        limiter = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(*[self._fetch_details(g, limiter) for g in games])
+    
     def get_million_plus_games(self) -> List[GameData]:
         """Get only games with $1M+ prizes"""
-        all_games = self.scrape_all_games()
+        all_games = self.scrape_all_games(million_only=True)
         million_games = [g for g in all_games if g.has_million_plus()]
         self.log(f"\nFound {len(million_games)} games with $1M+ prizes")
         return million_games
 
 
+@functools.lru_cache(maxsize=64)
 def format_currency(value: float) -> str:
     """Format currency for display"""
     if value >= 1_000_000:
@@ -450,6 +648,21 @@ def format_currency(value: float) -> str:
         return f"${value:.0f}"
 
 
+# Report colors: good / borderline / poor
+_COLOR_GOOD = "#00FF88"
+_COLOR_WARN = "#FFD700"
+_COLOR_BAD = "#FF6B6B"
+
+
+def _traffic_light(pct: float, hi: float = 70, mid: float = 40) -> str:
+    """Color for a percentage-style metric: good at >= hi, borderline at >= mid"""
+    if pct >= hi:
+        return _COLOR_GOOD
+    if pct >= mid:
+        return _COLOR_WARN
+    return _COLOR_BAD
+
+
 def calculate_composite_score(game: GameData) -> float:
     """
     Calculate a composite score for ranking games.
@@ -462,14 +675,21 @@ def calculate_composite_score(game: GameData) -> float:
     - Freshness bonus: 10% (newer games)
     """
     _, _, million_pct = game.calculate_million_health()
-    loss_min_score = game.calculate_loss_minimization_score()
-    diff = game.calculate_differential()
-    
+    return _score_from_metrics(
+        million_pct,
+        game.calculate_loss_minimization_score(),
+        game.calculate_differential(),
+        game.days_since_launch(),
+    )
+
+
+def _score_from_metrics(million_pct: float, loss_min_score: float, diff: float,
+                        days: Optional[int]) -> float:
+    """Composite score from already-computed game metrics"""
     # Normalize differential to 0-100 scale (typically ranges from -30 to +30)
     diff_normalized = max(0, min(100, (diff + 30) * (100/60)))
     
     # Freshness: newer games get a bonus
-    days = game.days_since_launch()
     if days is not None:
         if days < 30:
             freshness = 100
@@ -492,12 +712,18 @@ def calculate_composite_score(game: GameData) -> float:
     return score
 
 
-def categorize_game(game: GameData) -> str:
+def categorize_game(game: GameData) -> Category:
     """Categorize game as HOT, WATCH, or AVOID"""
     _, _, million_pct = game.calculate_million_health()
-    bottom_pct = game.calculate_bottom_depletion()
-    diff = game.calculate_differential()
-    
+    return _categorize_from_metrics(
+        million_pct,
+        game.calculate_bottom_depletion(),
+        game.calculate_differential(),
+    )
+
+
+def _categorize_from_metrics(million_pct: float, bottom_pct: float, diff: float) -> Category:
+    """HOT / WATCH / AVOID from already-computed game metrics"""
     # HOT: Strong million retention with good differential
     if million_pct >= 70 and diff > 0:
         return "HOT"
@@ -518,134 +744,31 @@ def categorize_game(game: GameData) -> str:
     return "WATCH"
 
 
-def generate_html_report(games: List[GameData]) -> str:
-    """Generate the HTML strategy report"""
+def rank_games(games: List[GameData]) -> List[GameData]:
+    """
+    Compute each game's metrics, composite score and category once, caching
+    them on the game, and return the games best score first.
+    """
+    for g in games:
+        if g._score is not None:
+            continue
+        million_rem, million_tot, million_pct = g.calculate_million_health()
+        loss_min_score = g.calculate_loss_minimization_score()
+        bottom_pct = g.calculate_bottom_depletion()
+        diff = g.calculate_differential()
+        days = g.days_since_launch()
+        
+        g._metrics = GameMetrics(million_rem, million_tot, million_pct,
+                                 loss_min_score, bottom_pct, diff, days)
+        g._score = _score_from_metrics(million_pct, loss_min_score, diff, days)
+        g._category = _categorize_from_metrics(million_pct, bottom_pct, diff)
     
-    eastern_now = get_eastern_time()
-    report_time = eastern_now.strftime('%B %d, %Y at %I:%M %p') + ' EST'
-    
-    # Sort games by composite score
-    scored_games = [(g, calculate_composite_score(g), categorize_game(g)) for g in games]
-    scored_games.sort(key=lambda x: x[1], reverse=True)
-    
-    # Separate by category
-    hot_games = [(g, s) for g, s, c in scored_games if c == "HOT"]
-    watch_games = [(g, s) for g, s, c in scored_games if c == "WATCH"]
-    avoid_games = [(g, s) for g, s, c in scored_games if c == "AVOID"]
-    
-    def generate_game_card(game: GameData, score: float, rank: int = None) -> str:
-        """Generate HTML for a single game card"""
-        million_rem, million_tot, million_pct = game.calculate_million_health()
-        loss_min_score = game.calculate_loss_minimization_score()
-        bottom_pct = game.calculate_bottom_depletion()
-        diff = game.calculate_differential()
-        days = game.days_since_launch()
-        
-        # Color coding
-        million_color = "#00FF88" if million_pct >= 70 else "#FFD700" if million_pct >= 40 else "#FF6B6B"
-        loss_min_color = "#00FF88" if loss_min_score >= 70 else "#FFD700" if loss_min_score >= 50 else "#FF6B6B"
-        diff_color = "#00FF88" if diff > 0 else "#FF6B6B"
-        
-        # Days display
-        days_str = f"{days} days old" if days else "Age unknown"
-        days_badge = ""
-        if days is not None:
-            if days < 30:
-                days_badge = '<span class="badge new">NEW</span>'
-            elif days < 90:
-                days_badge = '<span class="badge fresh">FRESH</span>'
-        
-        # Million tier breakdown
-        million_tiers = game.get_million_plus_tiers()
-        million_breakdown = ""
-        for tier in sorted(million_tiers, key=lambda x: x.value, reverse=True):
-            tier_color = "#00FF88" if tier.percent_remaining >= 70 else "#FFD700" if tier.percent_remaining >= 40 else "#FF6B6B"
-            million_breakdown += f'''
-                <div class="tier-row">
-                    <span class="tier-value">{format_currency(tier.value)}</span>
-                    <span class="tier-remaining" style="color: {tier_color}">{tier.remaining} of {tier.total} ({tier.percent_remaining:.0f}%)</span>
-                </div>
-            '''
-        
-        rank_display = f'<span class="rank">#{rank}</span>' if rank else ''
-        
-        return f'''
-        <div class="game-card">
-            <div class="game-header">
-                {rank_display}
-                <div class="game-title">
-                    <h3>{game.game_name} {days_badge}</h3>
-                    <span class="game-meta">${int(game.ticket_price)} ticket • Game #{game.game_number} • {days_str}</span>
-                </div>
-                <div class="score">Score: {score:.0f}</div>
-            </div>
-            
-            <div class="metrics-grid">
-                <div class="metric">
-                    <div class="metric-label">MILLION+ PRIZES</div>
-                    <div class="metric-value" style="color: {million_color}">{million_rem} of {million_tot} ({million_pct:.0f}%)</div>
-                    <div class="tier-breakdown">
-                        {million_breakdown}
-                    </div>
-                </div>
-                
-                <div class="metric">
-                    <div class="metric-label">LOSS MINIMIZATION</div>
-                    <div class="metric-value" style="color: {loss_min_color}">{loss_min_score:.0f}</div>
-                    <div class="metric-sub">Weighted score (0-100)</div>
-                </div>
-                
-                <div class="metric">
-                    <div class="metric-label">GAME MATURITY</div>
-                    <div class="metric-value">{100 - bottom_pct:.0f}% sold</div>
-                    <div class="metric-sub">Based on bottom prize depletion</div>
-                </div>
-                
-                <div class="metric">
-                    <div class="metric-label">DIFFERENTIAL</div>
-                    <div class="metric-value" style="color: {diff_color}">{diff:+.1f}%</div>
-                    <div class="metric-sub">Top vs bottom prize %</div>
-                </div>
-            </div>
-            
-            <a href="{game.url}" target="_blank" class="game-link">View on NC Lottery →</a>
-        </div>
-        '''
-    
-    # Generate quick reference table
-    quick_ref_rows = ""
-    for rank, (game, score, cat) in enumerate(scored_games, 1):
-        million_rem, million_tot, million_pct = game.calculate_million_health()
-        loss_min_score = game.calculate_loss_minimization_score()
-        diff = game.calculate_differential()
-        
-        cat_class = cat.lower()
-        diff_color = "#00FF88" if diff > 0 else "#FF6B6B"
-        loss_min_color = "#00FF88" if loss_min_score >= 70 else "#FFD700" if loss_min_score >= 50 else "#FF6B6B"
-        
-        quick_ref_rows += f'''
-            <tr class="cat-{cat_class}">
-                <td>{rank}</td>
-                <td class="game-name-cell">{game.game_name}</td>
-                <td>${int(game.ticket_price)}</td>
-                <td>{million_rem}/{million_tot} ({million_pct:.0f}%)</td>
-                <td style="color: {loss_min_color}">{loss_min_score:.0f}</td>
-                <td style="color: {diff_color}">{diff:+.1f}%</td>
-                <td><span class="cat-badge {cat_class}">{cat}</span></td>
-                <td>{score:.0f}</td>
-            </tr>
-        '''
-    
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>NC Lottery $1M+ Strategy Monitor</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet">
-    <style>
-        :root {{
+    return sorted(games, key=attrgetter('_score'), reverse=True)
+
+
+# Static stylesheet for the report, passed into templates/report.html.j2
+_CSS = """\
+        :root {
             --bg-primary: #0a0a0f;
             --bg-secondary: #14141c;
             --bg-card: #1c1c28;
@@ -657,44 +780,44 @@ def generate_html_report(games: List[GameData]) -> str:
             --accent-red: #FF6B6B;
             --accent-cyan: #00FFFF;
             --border-color: rgba(255,255,255,0.12);
-        }}
+        }
         
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        * { margin: 0; padding: 0; box-sizing: border-box; }
         
-        body {{
+        body {
             font-family: 'Outfit', sans-serif;
             background: var(--bg-primary);
             color: var(--text-primary);
             line-height: 1.6;
             padding: 2rem;
             font-weight: 400;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
-        }}
+        }
         
-        header {{
+        header {
             text-align: center;
             padding: 2rem 0 3rem;
             border-bottom: 1px solid var(--border-color);
             margin-bottom: 2rem;
-        }}
+        }
         
-        h1 {{
+        h1 {
             font-size: 2.5rem;
             font-weight: 800;
             color: var(--accent-gold);
             margin-bottom: 0.5rem;
-        }}
+        }
         
-        .subtitle {{
+        .subtitle {
             color: var(--text-secondary);
             font-size: 1.1rem;
-        }}
+        }
         
-        .report-time {{
+        .report-time {
             display: inline-block;
             margin-top: 1rem;
             padding: 0.5rem 1rem;
@@ -703,58 +826,58 @@ def generate_html_report(games: List[GameData]) -> str:
             font-family: 'JetBrains Mono', monospace;
             font-size: 0.85rem;
             color: var(--text-muted);
-        }}
+        }
         
-        .section {{
+        .section {
             margin-bottom: 3rem;
-        }}
+        }
         
-        .section-header {{
+        .section-header {
             display: flex;
             align-items: center;
             gap: 1rem;
             margin-bottom: 1.5rem;
             padding-bottom: 0.75rem;
             border-bottom: 1px solid var(--border-color);
-        }}
+        }
         
-        .section-icon {{
+        .section-icon {
             font-size: 1.5rem;
-        }}
+        }
         
-        .section-title {{
+        .section-title {
             font-size: 1.5rem;
             font-weight: 700;
-        }}
+        }
         
-        .section-count {{
+        .section-count {
             background: var(--bg-card);
             padding: 0.25rem 0.75rem;
             border-radius: 1rem;
             font-size: 0.85rem;
             color: var(--text-secondary);
-        }}
+        }
         
-        .hot .section-title {{ color: var(--accent-green); }}
-        .watch .section-title {{ color: var(--accent-gold); }}
-        .avoid .section-title {{ color: var(--accent-red); }}
+        .hot .section-title { color: var(--accent-green); }
+        .watch .section-title { color: var(--accent-gold); }
+        .avoid .section-title { color: var(--accent-red); }
         
-        .game-card {{
+        .game-card {
             background: var(--bg-card);
             border: 1px solid var(--border-color);
             border-radius: 1rem;
             padding: 1.5rem;
             margin-bottom: 1rem;
-        }}
+        }
         
-        .game-header {{
+        .game-header {
             display: flex;
             align-items: flex-start;
             gap: 1rem;
             margin-bottom: 1.5rem;
-        }}
+        }
         
-        .rank {{
+        .rank {
             background: linear-gradient(135deg, #4A90D9, #8B5CF6);
             color: white;
             font-weight: 700;
@@ -762,25 +885,25 @@ def generate_html_report(games: List[GameData]) -> str:
             padding: 0.5rem 1rem;
             border-radius: 0.5rem;
             font-family: 'JetBrains Mono', monospace;
-        }}
+        }
         
-        .game-title {{
+        .game-title {
             flex: 1;
-        }}
+        }
         
-        .game-title h3 {{
+        .game-title h3 {
             font-size: 1.25rem;
             font-weight: 600;
             margin-bottom: 0.25rem;
-        }}
+        }
         
-        .game-meta {{
+        .game-meta {
             font-size: 0.9rem;
             color: var(--text-secondary);
             font-weight: 500;
-        }}
+        }
         
-        .score {{
+        .score {
             background: var(--bg-secondary);
             padding: 0.5rem 1rem;
             border-radius: 0.5rem;
@@ -788,9 +911,9 @@ def generate_html_report(games: List[GameData]) -> str:
             font-weight: 700;
             font-size: 1.1rem;
             color: var(--accent-cyan);
-        }}
+        }
         
-        .badge {{
+        .badge {
             display: inline-block;
             padding: 0.15rem 0.5rem;
             border-radius: 0.25rem;
@@ -798,101 +921,101 @@ def generate_html_report(games: List[GameData]) -> str:
             font-weight: 600;
             margin-left: 0.5rem;
             text-transform: uppercase;
-        }}
+        }
         
-        .badge.new {{
+        .badge.new {
             background: var(--accent-green);
             color: black;
-        }}
+        }
         
-        .badge.fresh {{
+        .badge.fresh {
             background: var(--accent-cyan);
             color: black;
-        }}
+        }
         
-        .metrics-grid {{
+        .metrics-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 1rem;
             margin-bottom: 1rem;
-        }}
+        }
         
-        .metric {{
+        .metric {
             background: var(--bg-secondary);
             padding: 1rem;
             border-radius: 0.5rem;
-        }}
+        }
         
-        .metric-label {{
+        .metric-label {
             font-size: 0.8rem;
             font-weight: 700;
             color: var(--text-secondary);
             text-transform: uppercase;
             letter-spacing: 0.05em;
             margin-bottom: 0.5rem;
-        }}
+        }
         
-        .metric-value {{
+        .metric-value {
             font-size: 1.4rem;
             font-weight: 700;
             font-family: 'JetBrains Mono', monospace;
-        }}
+        }
         
-        .metric-sub {{
+        .metric-sub {
             font-size: 0.85rem;
             color: var(--text-muted);
             margin-top: 0.25rem;
             font-weight: 500;
-        }}
+        }
         
-        .tier-breakdown {{
+        .tier-breakdown {
             margin-top: 0.75rem;
             padding-top: 0.75rem;
             border-top: 1px solid var(--border-color);
-        }}
+        }
         
-        .tier-row {{
+        .tier-row {
             display: flex;
             justify-content: space-between;
             font-size: 0.9rem;
             padding: 0.35rem 0;
-        }}
+        }
         
-        .tier-value {{
+        .tier-value {
             color: var(--text-secondary);
             font-weight: 500;
-        }}
+        }
         
-        .tier-remaining {{
+        .tier-remaining {
             font-family: 'JetBrains Mono', monospace;
             font-weight: 600;
-        }}
+        }
         
-        .game-link {{
+        .game-link {
             display: inline-block;
             color: var(--accent-cyan);
             text-decoration: none;
             font-size: 0.9rem;
-        }}
+        }
         
-        .game-link:hover {{
+        .game-link:hover {
             text-decoration: underline;
-        }}
+        }
         
         /* Quick Reference Table */
-        .quick-ref {{
+        .quick-ref {
             background: var(--bg-card);
             border-radius: 1rem;
             overflow: hidden;
             margin-top: 2rem;
-        }}
+        }
         
-        .quick-ref table {{
+        .quick-ref table {
             width: 100%;
             border-collapse: collapse;
-        }}
+        }
         
-        .quick-ref th {{
+        .quick-ref th {
             background: var(--bg-secondary);
             padding: 1rem;
             text-align: left;
@@ -901,178 +1024,293 @@ def generate_html_report(games: List[GameData]) -> str:
             text-transform: uppercase;
             letter-spacing: 0.05em;
             color: var(--accent-cyan);
-        }}
+        }
         
-        .quick-ref td {{
+        .quick-ref td {
             padding: 0.85rem 1rem;
             border-bottom: 1px solid var(--border-color);
             font-size: 0.95rem;
             font-weight: 500;
-        }}
+        }
         
-        .quick-ref tr:last-child td {{
+        .quick-ref tr:last-child td {
             border-bottom: none;
-        }}
+        }
         
-        .quick-ref .game-name-cell {{
+        .quick-ref .game-name-cell {
             font-weight: 500;
-        }}
+        }
         
-        .cat-badge {{
+        .cat-badge {
             display: inline-block;
             padding: 0.2rem 0.5rem;
             border-radius: 0.25rem;
             font-size: 0.7rem;
             font-weight: 600;
-        }}
+        }
         
-        .cat-badge.hot {{
+        .cat-badge.hot {
             background: rgba(0, 255, 136, 0.2);
             color: var(--accent-green);
-        }}
+        }
         
-        .cat-badge.watch {{
+        .cat-badge.watch {
             background: rgba(255, 215, 0, 0.2);
             color: var(--accent-gold);
-        }}
+        }
         
-        .cat-badge.avoid {{
+        .cat-badge.avoid {
             background: rgba(255, 107, 107, 0.2);
             color: var(--accent-red);
-        }}
+        }
         
-        .cat-hot {{ background: rgba(0, 255, 136, 0.05); }}
-        .cat-avoid {{ background: rgba(255, 107, 107, 0.05); }}
+        .cat-hot { background: rgba(0, 255, 136, 0.05); }
+        .cat-avoid { background: rgba(255, 107, 107, 0.05); }
         
         /* Info Box */
-        .info-box {{
+        .info-box {
             background: var(--bg-secondary);
             border: 1px solid var(--border-color);
             border-left: 4px solid var(--accent-cyan);
             border-radius: 0.5rem;
             padding: 1.5rem;
             margin-bottom: 2rem;
-        }}
+        }
         
-        .info-box h3 {{
+        .info-box h3 {
             color: var(--accent-cyan);
             margin-bottom: 0.75rem;
             font-size: 1.1rem;
-        }}
+        }
         
-        .info-box p {{
+        .info-box p {
             color: var(--text-secondary);
             font-size: 1rem;
             margin-bottom: 0.5rem;
             font-weight: 400;
-        }}
+        }
         
         /* Responsive */
-        @media (max-width: 768px) {{
-            body {{ padding: 1rem; }}
-            h1 {{ font-size: 1.75rem; }}
-            .game-header {{ flex-direction: column; }}
-            .metrics-grid {{ grid-template-columns: 1fr; }}
-            .quick-ref {{ overflow-x: auto; }}
-            .quick-ref table {{ min-width: 700px; }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>💰 NC Lottery $1M+ Strategy Monitor</h1>
-            <p class="subtitle">Strategic analysis for million-dollar prize hunting</p>
-            <div class="report-time">Generated: {report_time}</div>
-        </header>
-        
-        <div class="info-box">
-            <h3>📊 How to Use This Report</h3>
-            <p><strong>Score</strong> combines: Million prize health (40%), Loss minimization (30%), Overall differential (20%), and Game freshness (10%).</p>
-            <p><strong>Loss Minimization</strong> is a weighted score (0-100) based on: break-even prizes at 50%, small wins $500-$1K at 30%, medium wins $2K-$10K at 20%.</p>
-            <p><strong>🔥 HOT:</strong> Strong million retention + positive indicators. Best opportunities.</p>
-            <p><strong>⚠️ WATCH:</strong> Decent potential but some concerns. Consider carefully.</p>
-            <p><strong>📉 AVOID:</strong> Million prizes depleted or depleting faster than expected.</p>
-            <p style="margin-top: 1rem; font-style: italic;">This is analysis, not advice. All lottery play involves risk. Play responsibly.</p>
-        </div>
-        
-        <div class="section hot">
-            <div class="section-header">
-                <span class="section-icon">🔥</span>
-                <h2 class="section-title">Top Opportunities</h2>
-                <span class="section-count">{len(hot_games)} games</span>
-            </div>
-            {''.join(generate_game_card(g, s, i+1) for i, (g, s) in enumerate(hot_games)) if hot_games else '<p style="color: var(--text-muted);">No games currently meet HOT criteria.</p>'}
-        </div>
-        
-        <div class="section watch">
-            <div class="section-header">
-                <span class="section-icon">⚠️</span>
-                <h2 class="section-title">Watch List</h2>
-                <span class="section-count">{len(watch_games)} games</span>
-            </div>
-            {''.join(generate_game_card(g, s) for g, s in watch_games) if watch_games else '<p style="color: var(--text-muted);">No games currently on watch list.</p>'}
-        </div>
-        
-        <div class="section avoid">
-            <div class="section-header">
-                <span class="section-icon">📉</span>
-                <h2 class="section-title">Avoid for $1M Strategy</h2>
-                <span class="section-count">{len(avoid_games)} games</span>
-            </div>
-            {''.join(generate_game_card(g, s) for g, s in avoid_games) if avoid_games else '<p style="color: var(--text-muted);">No games currently in avoid category.</p>'}
-        </div>
-        
-        <div class="section">
-            <div class="section-header">
-                <span class="section-icon">📋</span>
-                <h2 class="section-title" style="color: var(--text-primary);">Quick Reference: All $1M+ Games</h2>
-            </div>
-            <div class="quick-ref">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>#</th>
-                            <th>Game</th>
-                            <th>Price</th>
-                            <th>$1M+ Left</th>
-                            <th>Loss Min</th>
-                            <th>Diff</th>
-                            <th>Status</th>
-                            <th>Score</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {quick_ref_rows}
-                    </tbody>
-                </table>
-            </div>
-        </div>
-        
-        <footer style="text-align: center; padding: 2rem 0; color: var(--text-muted); font-size: 0.85rem;">
-            <p>Data sourced from <a href="https://nclottery.com" target="_blank" style="color: var(--accent-cyan);">NC Education Lottery</a></p>
-            <p>This tool is for informational purposes only. Lottery games are games of chance. Play responsibly.</p>
-        </footer>
-    </div>
-</body>
-</html>
-'''
-    
-    return html
+        @media (max-width: 768px) {
+            body { padding: 1rem; }
+            h1 { font-size: 1.75rem; }
+            .game-header { flex-direction: column; }
+            .metrics-grid { grid-template-columns: 1fr; }
+            .quick-ref { overflow-x: auto; }
+            .quick-ref table { min-width: 700px; }
+        }"""
+
+# Whitespace-collapsed copy that actually ships in the page, built once at import
+_CSS_MIN = re.sub(r"\s+", " ", _CSS).strip()
+
+_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# Templates are compiled once per process and never re-checked on disk;
+# scraped game names and URLs are HTML-escaped on output
+_ENV = Environment(
+    loader=FileSystemLoader(_TEMPLATE_DIR),
+    autoescape=select_autoescape(["html", "j2"]),
+    auto_reload=False,
+    cache_size=400,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+_REPORT_TMPL = _ENV.get_template("report.html.j2")
+
+
+class GameCard(NamedTuple):
+    """Pre-formatted fields of one game card; tiers are (value, color, left) triples"""
+    name: str
+    price: int
+    game_number: str
+    url: str
+    badge: str
+    badge_class: str
+    age: str
+    score: str
+    million_color: str
+    million_left: str
+    tiers: List[Tuple[str, str, str]]
+    loss_color: str
+    loss_min: str
+    sold: str
+    diff_color: str
+    diff: str
+
+
+def build_game_card(game: GameData, score: float, m: GameMetrics) -> GameCard:
+    """Read each game attribute once and format every card cell up front"""
+    days = m.days
+    if days is not None and days < 30:
+        badge = "NEW"
+    elif days is not None and days < 90:
+        badge = "FRESH"
+    else:
+        badge = ""
+    
+    return GameCard(
+        game.game_name,
+        int(game.ticket_price),
+        game.game_number,
+        game.url,
+        badge,
+        badge.lower(),
+        f"{days} days old" if days else "Age unknown",
+        f"{score:.0f}",
+        _traffic_light(m.million_pct),
+        f"{m.million_rem} of {m.million_tot} ({m.million_pct:.0f}%)",
+        [
+            (format_currency(t.value), _traffic_light(t._pct),
+             f"{t.remaining} of {t.total} ({t._pct:.0f}%)")
+            for t in game.get_million_plus_tiers()
+        ],
+        _traffic_light(m.loss_min_score, mid=50),
+        f"{m.loss_min_score:.0f}",
+        f"{100 - m.bottom_pct:.0f}",
+        _COLOR_GOOD if m.diff > 0 else _COLOR_BAD,
+        f"{m.diff:+.1f}",
+    )
+
+
+class QuickRefRow(NamedTuple):
+    """One pre-formatted row of the quick reference table"""
+    rank: int
+    css_class: str
+    name: str
+    price: int
+    million_left: str
+    loss_color: str
+    loss_min: str
+    diff_color: str
+    diff: str
+    category: Category
+    score: str
+
+
+def build_quick_ref_rows(scored_games: List[Tuple[GameData, float, Category, GameMetrics]]) -> List[QuickRefRow]:
+    """Format every quick reference cell up front so the template only substitutes"""
+    return [
+        QuickRefRow(
+            i,
+            cat.lower(),
+            g.game_name,
+            int(g.ticket_price),
+            f"{m.million_rem}/{m.million_tot} ({m.million_pct:.0f}%)",
+            _traffic_light(m.loss_min_score, mid=50),
+            f"{m.loss_min_score:.0f}",
+            _COLOR_GOOD if m.diff > 0 else _COLOR_BAD,
+            f"{m.diff:+.1f}",
+            cat,
+            f"{s:.0f}",
+        )
+        for i, (g, s, cat, m) in enumerate(scored_games, 1)
+    ]
+
+
+def _report_context(games: List[GameData]) -> Dict[str, object]:
+    """Build the template variables for the strategy report"""
+    
+    eastern_now = get_eastern_time()
+    report_time = eastern_now.strftime(_REPORT_TIME_FMT)
+    
+    # Metrics, score and category are computed once per game and shared by
+    # the cards and the quick reference
+    scored_games = [(g, g._score, g._category, g._metrics) for g in rank_games(games)]
+    
+    # Separate by category in one pass; each bucket stays in score order
+    buckets: Dict[Category, List[GameCard]] = {"HOT": [], "WATCH": [], "AVOID": []}
+    for g, s, c, m in scored_games:
+        buckets[c].append(build_game_card(g, s, m))
+    
+    return dict(
+        css=_CSS_MIN,
+        report_time=report_time,
+        hot_games=buckets["HOT"],
+        watch_games=buckets["WATCH"],
+        avoid_games=buckets["AVOID"],
+        quick_ref_rows=build_quick_ref_rows(scored_games),
+    )
+
+
+def generate_html_report(games: List[GameData]) -> str:
+    """Generate the HTML strategy report"""
+    return _REPORT_TMPL.render(**_report_context(games))
+
+
+def stream_html_report(games: List[GameData], buffer_items: int = 64) -> Iterator[bytes]:
+    """
+    Render the HTML strategy report as UTF-8 chunks. Jinja buffers by
+    template output item, not by character: each chunk joins buffer_items
+    items, where a whole game card counts as one item.
+    """
+    stream = _REPORT_TMPL.stream(**_report_context(games))
+    stream.enable_buffering(size=buffer_items)
+    for chunk in stream:
+        yield chunk.encode("utf-8")
+
+
+def _write_all(fd: int, data: bytes):
+    """os.write may be partial, so keep writing until every byte is out"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def write_report(path: str, chunks: Iterable[bytes]):
+    """
+    Stream encoded report chunks to path and a gzipped copy to path.gz,
+    then move both into place so readers never see a half-written report.
+    """
+    tmp_path = path + ".tmp"
+    gz_tmp_path = path + ".gz.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            # filename="" and mtime=0 keep the gzip header free of the temp name
+            # and timestamp, so identical reports give identical archives
+            with open(gz_tmp_path, "wb") as gz_file, \
+                    gzip.GzipFile(filename="", mode="wb", fileobj=gz_file, compresslevel=9, mtime=0) as gz:
+                for data in chunks:
+                    _write_all(fd, data)
+                    gz.write(data)
+        finally:
+            os.close(fd)
+        
+        os.replace(tmp_path, path)
+        os.replace(gz_tmp_path, path + ".gz")
+    except BaseException:
+        # A failed render must not leave temp files next to the published report
+        for leftover in (tmp_path, gz_tmp_path):
+            try:
+                os.unlink(leftover)
+            except FileNotFoundError:
+                pass
+        raise
 
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="NC Lottery $1M+ Strategy Monitor")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="bypass the local HTTP cache and fetch fresh pages")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="only log scraper warnings, not per-page progress")
+    args = parser.parse_args()
+    
+    # stdout keeps scraper progress in order with the summary prints below
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format="%(message)s", stream=sys.stdout)
+    
     print("=" * 60)
     print("NC Lottery $1M+ Strategy Monitor")
     print("=" * 60)
     
     eastern_now = get_eastern_time()
-    print(f"Started at: {eastern_now.strftime('%Y-%m-%d %H:%M:%S')} Eastern")
+    print(f"Started at: {eastern_now.strftime(_CONSOLE_TIME_FMT)} Eastern")
     print()
     
     # Run analysis
-    analyzer = NCLotteryAnalyzer(delay_seconds=0.5, verbose=True)
+    analyzer = NCLotteryAnalyzer(delay_seconds=0.5, verbose=True, use_cache=not args.no_cache)
     million_games = analyzer.get_million_plus_games()
     
     if not million_games:
@@ -1083,25 +1321,23 @@ def main():
     print(f"ANALYSIS COMPLETE: {len(million_games)} games with $1M+ prizes")
     print("=" * 60)
     
-    # Show quick summary
-    scored = [(g, calculate_composite_score(g), categorize_game(g)) for g in million_games]
-    scored.sort(key=lambda x: x[1], reverse=True)
+    # Show quick summary; scores are cached on the games for the report
+    ranked = rank_games(million_games)
     
     print("\nTop 5 Opportunities:")
-    for i, (game, score, cat) in enumerate(scored[:5], 1):
-        million_rem, million_tot, million_pct = game.calculate_million_health()
-        print(f"  #{i}: {game.game_name} (${int(game.ticket_price)})")
-        print(f"      $1M+: {million_rem}/{million_tot} ({million_pct:.0f}%) | Score: {score:.0f} | {cat}")
+    for i, game in enumerate(ranked[:5], 1):
+        m = game._metrics
+        print(f"  #{i}: {game.game_name} (${int(game.ticket_price)})\n"
+              f"      $1M+: {m.million_rem}/{m.million_tot} ({m.million_pct:.0f}%) | Score: {game._score:.0f} | {game._category}")
     
     # Generate HTML report
     print("\nGenerating HTML report...")
-    html = generate_html_report(million_games)
-    
-    with open("index.html", "w", encoding="utf-8") as f:
-        f.write(html)
+    # Rendered straight to disk; index.html.gz is the precompressed copy
+    # for static hosts that serve .gz variants
+    write_report("index.html", stream_html_report(ranked))
     
-    print(f"Report saved to: index.html")
-    print(f"\nFinished at: {get_eastern_time().strftime('%Y-%m-%d %H:%M:%S')} Eastern")
+    print(f"Report saved to: index.html (+ index.html.gz)")
+    print(f"\nFinished at: {get_eastern_time().strftime(_CONSOLE_TIME_FMT)} Eastern")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+"""Detail-page parsing against small fixture pages, without hitting the network"""
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nc_lottery_million_monitor import GameData, NCLotteryAnalyzer
+
+
+def _details(html: str):
+    analyzer = NCLotteryAnalyzer(verbose=False, use_cache=False)
+    analyzer.fetch_page = lambda url: html
+    return analyzer.get_game_details_from_page("https://nclottery.com/scratch-off/900/test")
+
+
+class GameDetailsFromPageTest(unittest.TestCase):
+    def test_label_and_value_in_adjacent_table_cells(self):
+        html = """<html><body><table>
+            <tr><td><strong>Ticket Price</strong></td><td>$10</td></tr>
+            <tr><td><strong>Start Date</strong></td><td>Sep 1, 2026</td></tr>
+        </table></body></html>"""
+        self.assertEqual(_details(html), (10.0, "Sep 1, 2026"))
+
+    def test_label_and_value_in_nested_blocks(self):
+        html = """<html><body><div>
+            <div><b>Ticket Price</b></div><div>$10</div>
+        </div></body></html>"""
+        self.assertEqual(_details(html), (10.0, None))
+
+    def test_lower_case_labels(self):
+        html = """<html><body>
+            <p>Ticket price: $5</p><p>Start date: Jan 15, 2026</p>
+        </body></html>"""
+        self.assertEqual(_details(html), (5.0, "Jan 15, 2026"))
+
+    def test_empty_body_gives_empty_result(self):
+        self.assertEqual(_details("   "), (0.0, None))
+        self.assertEqual(_details("<!-- nothing here -->"), (0.0, None))
+
+    def test_xhtml_with_encoding_declaration(self):
+        html = """<?xml version="1.0" encoding="utf-8"?>
+            <html><body><p>Ticket Price $20</p><p>Start Date: Mar 3, 2026</p></body></html>"""
+        self.assertEqual(_details(html), (20.0, "Mar 3, 2026"))
+
+
+class FetchAllDetailsTest(unittest.TestCase):
+    def test_one_failing_page_does_not_abort_the_rest(self):
+        analyzer = NCLotteryAnalyzer(delay_seconds=0, verbose=False, use_cache=False)
+
+        def details(url):
+            if url.endswith("/bad"):
+                raise RuntimeError("boom")
+            return 10.0, "Sep 1, 2026"
+
+        analyzer.get_game_details_from_page = details
+        games = [GameData("1", "Good", 0.0, "u/good"), GameData("2", "Bad", 0.0, "u/bad")]
+        asyncio.run(analyzer._fetch_all_details(games))
+        self.assertEqual([g.ticket_price for g in games], [10.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
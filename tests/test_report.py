@@ -0,0 +1,25 @@
+"""HTML report rendering from in-memory games"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nc_lottery_million_monitor import GameData, PrizeTier, generate_html_report
+
+
+class GenerateHtmlReportTest(unittest.TestCase):
+    def test_scraped_strings_are_escaped_and_css_is_not(self):
+        game = GameData(
+            "900", "Lucky & <Gold>", 10.0, 'https://nclottery.com/scratch-off/900/"x"',
+            prize_tiers=[PrizeTier(1_000_000, 4, 3), PrizeTier(20, 1000, 500)],
+        )
+        html = generate_html_report([game])
+        self.assertIn("Lucky &amp; &lt;Gold&gt;", html)
+        self.assertNotIn("<Gold>", html)
+        self.assertIn('href="https://nclottery.com/scratch-off/900/&#34;x&#34;"', html)
+        self.assertIn(".quick-ref table { min-width: 700px; }", html)
+
+
+if __name__ == "__main__":
+    unittest.main()